@@ -8,17 +8,23 @@ import sys
 from flask import Flask
 from service import config
 from service.common import log_handlers
+from service.common.json_provider import ORJSONProvider
 from flask_talisman import Talisman
 from flask_cors import CORS
+from flask_caching import Cache
 
 # Create Flask application
 app = Flask(__name__)
 app.config.from_object(config)
+# Serialize and parse JSON with orjson
+app.json = ORJSONProvider(app)
 
 # Add Flask Talisman to the app to add HTTP security headers
 talisman = Talisman(app)
 # Add Flask CORS to the app to add CORS HTTP headers
 cors = CORS(app)
+# Add Flask Caching to the app to memoize read-only endpoints
+cache = Cache(app)
 
 # Import the routes After the Flask app is created
 # pylint: disable=wrong-import-position, cyclic-import, wrong-import-order
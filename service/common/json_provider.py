@@ -0,0 +1,20 @@
+"""
+JSON Provider
+
+This module contains a Flask JSON provider that uses orjson
+to serialize and parse JSON
+"""
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson"""
+
+    def dumps(self, obj, **kwargs):
+        """Serialize data as JSON, formatting options are ignored"""
+        return orjson.dumps(obj, default=str).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize data as JSON"""
+        return orjson.loads(s)
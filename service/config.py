@@ -19,5 +19,16 @@ if not DATABASE_URI:
 SQLALCHEMY_DATABASE_URI = DATABASE_URI
 SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+# Configure Flask-Caching
+# SimpleCache lives in one process and each process only evicts its own
+# entries, so it is only safe with a single worker and replica. Set
+# CACHE_TYPE to a shared backend such as RedisCache (which also needs
+# CACHE_REDIS_URL and the redis package), or to NullCache, when several
+# replicas serve the API.
+CACHE_TYPE = os.getenv("CACHE_TYPE", "SimpleCache")
+CACHE_DEFAULT_TIMEOUT = int(os.getenv("CACHE_DEFAULT_TIMEOUT", "60"))
+CACHE_THRESHOLD = int(os.getenv("CACHE_THRESHOLD", "1024"))
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL")
+
 # Secret for session management
 SECRET_KEY = os.getenv("SECRET_KEY", "s3cr3t-key-shhhh")
@@ -12,6 +12,9 @@ logger = logging.getLogger("flask.app")
 # Create the SQLAlchemy object to be initialized later in init_db()
 db = SQLAlchemy()
 
+# Fields of an Account in the order they are serialized
+ACCOUNT_FIELDS = ("id", "name", "email", "address", "phone_number", "date_joined")
+
 
 class DataValidationError(Exception):
     """Used for an data validation errors when deserializing"""
@@ -40,6 +43,22 @@ class PersistentBase:
         db.session.add(self)
         db.session.commit()
 
+    @classmethod
+    def create_many(cls, records):
+        """
+        Creates a batch of Accounts in the database with a single commit
+        and returns their new ids in the same order
+        """
+        logger.info("Creating %d records", len(records))
+        for record in records:
+            record.id = None  # id must be none to generate next primary key
+        db.session.add_all(records)
+        db.session.flush()
+        # Read the ids before the commit expires the records
+        ids = [record.id for record in records]
+        db.session.commit()
+        return ids
+
     def update(self):
         """
         Updates a Account to the database
@@ -73,7 +92,7 @@ class PersistentBase:
     def find(cls, by_id):
         """Finds a record by it's ID"""
         logger.info("Processing lookup for id %s ...", by_id)
-        return cls.query.get(by_id)
+        return db.session.get(cls, by_id)
 
 
 ######################################################################
@@ -99,32 +118,41 @@ class Account(db.Model, PersistentBase):
 
     def serialize(self):
         """Serializes a Account into a dictionary"""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "email": self.email,
-            "address": self.address,
-            "phone_number": self.phone_number,
-            "date_joined": self.date_joined.isoformat()
-        }
+        data = {field: getattr(self, field) for field in ACCOUNT_FIELDS}
+        data["date_joined"] = self.date_joined.isoformat()
+        return data
 
     def deserialize(self, data):
         """
         Deserializes a Account from a dictionary
 
+        Args:
+            data (dict): A dictionary containing the resource data
+        """
+        for field, value in self.validate(data).items():
+            setattr(self, field, value)
+        return self
+
+    @staticmethod
+    def validate(data):
+        """
+        Validates Account data and returns its column values without the id
+
         Args:
             data (dict): A dictionary containing the resource data
         """
         try:
-            self.name = data["name"]
-            self.email = data["email"]
-            self.address = data["address"]
-            self.phone_number = data.get("phone_number")
+            values = {
+                "name": data["name"],
+                "email": data["email"],
+                "address": data["address"],
+                "phone_number": data.get("phone_number"),
+            }
             date_joined = data.get("date_joined")
             if date_joined:
-                self.date_joined = date.fromisoformat(date_joined)
+                values["date_joined"] = date.fromisoformat(date_joined)
             else:
-                self.date_joined = date.today()
+                values["date_joined"] = date.today()
         except KeyError as error:
             raise DataValidationError("Invalid Account: missing " + error.args[0]) from error
         except TypeError as error:
@@ -132,7 +160,7 @@ class Account(db.Model, PersistentBase):
                 "Invalid Account: body of request contained "
                 "bad or no data - " + error.args[0]
             ) from error
-        return self
+        return values
 
     @classmethod
     def find_by_name(cls, name):
@@ -4,10 +4,48 @@ Account Service
 This microservice handles the lifecycle of Accounts
 """
 # pylint: disable=unused-import
+import orjson
 from flask import jsonify, request, make_response, abort, url_for   # noqa; F401
-from service.models import Account
+from sqlalchemy import bindparam, delete, insert, select, update
+from service.models import db, Account, ACCOUNT_FIELDS
 from service.common import status  # HTTP Status Codes
-from . import app  # Import Flask application
+from . import app, cache  # Import Flask application and cache
+
+# Cache key for the list of all accounts
+ACCOUNTS_CACHE_KEY = "accounts_all"
+
+# HTTP methods whose request body must be JSON, and the accepted media types
+JSON_BODY_METHODS = frozenset({"POST", "PUT"})
+JSON_MIMETYPES = frozenset({"application/json"})
+
+# Columns selected when listing accounts, in serialization order
+ACCOUNT_COLUMNS = tuple(getattr(Account, field) for field in ACCOUNT_FIELDS)
+
+# Statements built once so each request only binds parameters. The VALUES
+# and SET clauses are taken from the column values bound at execution.
+INSERT_ACCOUNT = insert(Account).returning(*ACCOUNT_COLUMNS)
+UPDATE_ACCOUNT = (
+    update(Account)
+    .where(Account.id == bindparam("account_id"))
+    .returning(*ACCOUNT_COLUMNS)
+    .execution_options(synchronize_session=False)
+)
+DELETE_ACCOUNT = (
+    delete(Account)
+    .where(Account.id == bindparam("account_id"))
+    .returning(Account.id)
+    .execution_options(synchronize_session=False)
+)
+
+# Constant response bodies, serialized once at import time
+HEALTH_BODY = app.json.dumps({"status": "OK"})
+INDEX_BODY = app.json.dumps(
+    {
+        "name": "Account REST API Service",
+        "version": "1.0",
+        # "paths": url_for("list_accounts", _external=True),
+    }
+)
 
 
 ############################################################
@@ -16,7 +54,9 @@ from . import app  # Import Flask application
 @app.route("/health")
 def health():
     """Health Status"""
-    return jsonify(dict(status="OK")), status.HTTP_200_OK
+    return app.response_class(
+        HEALTH_BODY, status=status.HTTP_200_OK, mimetype="application/json"
+    )
 
 
 ######################################################################
@@ -25,13 +65,8 @@ def health():
 @app.route("/")
 def index():
     """Root URL response"""
-    return (
-        jsonify(
-            name="Account REST API Service",
-            version="1.0",
-            # paths=url_for("list_accounts", _external=True),
-        ),
-        status.HTTP_200_OK,
+    return app.response_class(
+        INDEX_BODY, status=status.HTTP_200_OK, mimetype="application/json"
     )
 
 
@@ -45,81 +80,110 @@ def create_accounts():
     This endpoint will create an Account based the data in the body that is posted
     """
     app.logger.info("Request to create an Account")
-    check_content_type("application/json")
-    account = Account()
-    account.deserialize(request.get_json())
-    account.create()
-    message = account.serialize()
+    # Insert the validated values and read the new Account back in one statement
+    values = Account.validate(request.get_json(cache=False))
+    row = db.session.execute(INSERT_ACCOUNT, values).first()
+    db.session.commit()
+    cache.delete(ACCOUNTS_CACHE_KEY)
+    message = dict(zip(ACCOUNT_FIELDS, row))
     # Uncomment once get_accounts has been implemented
-    # location_url = url_for("get_accounts", account_id=account.id, _external=True)
+    # location_url = url_for("get_accounts", account_id=message["id"], _external=True)
     location_url = "/"  # Remove once get_accounts has been implemented
     return make_response(
         jsonify(message), status.HTTP_201_CREATED, {"Location": location_url}
     )
 
+
+######################################################################
+# CREATE ACCOUNTS IN BULK
+######################################################################
+@app.route("/accounts/bulk", methods=["POST"])
+def create_accounts_bulk():
+    """
+    Creates a batch of Accounts
+    This endpoint will create all Accounts in the list posted in the body
+    and return their ids in the same order
+    """
+    app.logger.info("Request to create Accounts in bulk")
+    payload = request.get_json()
+    if not isinstance(payload, list):
+        abort(status.HTTP_400_BAD_REQUEST, "Request body must be a list of Accounts")
+    accounts = [Account().deserialize(data) for data in payload]
+    ids = Account.create_many(accounts)
+    cache.delete(ACCOUNTS_CACHE_KEY)
+    return jsonify(ids), status.HTTP_201_CREATED
+
 ######################################################################
 # LIST ALL ACCOUNTS
 ######################################################################
 
 
 @app.route("/accounts", methods=["GET"])
+@cache.cached(key_prefix=ACCOUNTS_CACHE_KEY)
 def list_accounts() -> tuple:
     """
     List all accounts that are in the database.
     """
-    app.logger.info("GET request to /accounts")
-    all_accounts = Account.all()
-    # Serialize into list of dicts
-    all_accounts = [acc.serialize() for acc in all_accounts]
-    return jsonify(all_accounts), status.HTTP_200_OK
+    # Select the columns directly instead of hydrating ORM instances
+    rows = db.session.execute(select(*ACCOUNT_COLUMNS)).all()
+    # Encode straight to bytes, skipping jsonify's str round trip
+    response = app.response_class(
+        orjson.dumps([dict(zip(ACCOUNT_FIELDS, row)) for row in rows]),
+        status=status.HTTP_200_OK,
+        mimetype="application/json",
+    )
+    # The ETag is cached with the response and checked in check_etag
+    response.add_etag(weak=True)
+    return response
 
 ######################################################################
 # READ AN ACCOUNT
 ######################################################################
 
 
-@app.route("/accounts/<id>", methods=["GET"])
+@app.route("/accounts/<int:id>", methods=["GET"])
+@cache.cached(make_cache_key=lambda id: account_cache_key(id))
 def read_account(id: int) -> tuple:
-    search_result = Account.find(id)
-    was_found = bool(search_result)
-    status_code = status.HTTP_200_OK if was_found else status.HTTP_404_NOT_FOUND
-    response_body = search_result.serialize() if was_found else {}
+    account = Account.find(id)
+    if not account:
+        abort(status.HTTP_404_NOT_FOUND, f"Account with id {id} could not be found :(")
 
-    if not was_found:
-        abort(status_code, f"Account with id {id} could not be found :(")
-
-    return jsonify(response_body), status_code
+    response = jsonify(account.serialize())
+    # The ETag is cached with the response and checked in check_etag
+    response.add_etag(weak=True)
+    return response, status.HTTP_200_OK
 
 ######################################################################
 # UPDATE AN EXISTING ACCOUNT
 ######################################################################
 
 
-@app.route("/accounts/<id>", methods=["PUT"])
+@app.route("/accounts/<int:id>", methods=["PUT"])
 def update_accounts(id: int) -> tuple:
-    search_result = Account.find(id)
-    was_found = bool(search_result)
-    status_code = status.HTTP_200_OK if was_found else status.HTTP_404_NOT_FOUND
-    if was_found:
-        # Deserialize json into python dictionary
-        search_result.deserialize(request.get_json())
-        search_result.update()
-
-        return search_result.serialize(), status_code
-    else:
-        abort(status_code)
+    app.logger.info("Request to update Account with id %s", id)
+    # Validate the body before touching the database
+    values = Account.validate(request.get_json(cache=False))
+    # Update and read back the Account in a single round trip
+    row = db.session.execute(UPDATE_ACCOUNT, {"account_id": id, **values}).first()
+    if row is None:
+        db.session.rollback()
+        abort(status.HTTP_404_NOT_FOUND, f"Account with id {id} could not be found :(")
+    db.session.commit()
+    evict_account(id)
+    return jsonify(dict(zip(ACCOUNT_FIELDS, row))), status.HTTP_200_OK
 
 ######################################################################
 # DELETE AN ACCOUNT
 ######################################################################
 
 
-@app.route("/accounts/<id>", methods=["DELETE"])
+@app.route("/accounts/<int:id>", methods=["DELETE"])
 def delete_account(id: int) -> tuple:
-    search_result = Account.find(id)
-    was_found = bool(search_result)
-    if was_found:
-        search_result.delete()
+    app.logger.info("Request to delete Account with id %s", id)
+    row = db.session.execute(DELETE_ACCOUNT, {"account_id": id}).first()
+    db.session.commit()
+    if row is not None:
+        evict_account(id)
     return "", status.HTTP_204_NO_CONTENT
 
 ######################################################################
@@ -127,13 +191,37 @@ def delete_account(id: int) -> tuple:
 ######################################################################
 
 
-def check_content_type(media_type):
-    """Checks that the media type is correct"""
-    content_type = request.headers.get("Content-Type")
-    if content_type and content_type == media_type:
+def account_cache_key(account_id):
+    """Returns the cache key of a single Account"""
+    return f"acct:{account_id}"
+
+
+def evict_account(account_id):
+    """Removes an Account and the list of all Accounts from the cache"""
+    # Flask-Caching's delete_many stops at the first missing key
+    cache.delete(ACCOUNTS_CACHE_KEY)
+    cache.delete(account_cache_key(account_id))
+
+
+@app.before_request
+def check_content_type():
+    """Checks that the media type of request bodies is JSON"""
+    # Let Flask answer unknown URLs and methods with 404 or 405 first
+    if request.routing_exception is not None:
         return
-    app.logger.error("Invalid Content-Type: %s", content_type)
-    abort(
-        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-        f"Content-Type must be {media_type}",
-    )
+    if request.method in JSON_BODY_METHODS and request.mimetype not in JSON_MIMETYPES:
+        app.logger.error("Invalid Content-Type: %s", request.content_type)
+        abort(
+            status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            "Content-Type must be application/json",
+        )
+
+
+@app.after_request
+def check_etag(response):
+    """Answers GET requests with 304 Not Modified when the client's ETag matches"""
+    if request.method == "GET" and response.status_code == status.HTTP_200_OK:
+        etag, _ = response.get_etag()
+        if etag:
+            response.make_conditional(request)
+    return response
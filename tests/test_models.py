@@ -5,6 +5,7 @@ Test cases for Account Model
 import logging
 import unittest
 import os
+from sqlalchemy import text
 from service import app
 from service.models import Account, DataValidationError, db
 from tests.factories import AccountFactory
@@ -35,7 +36,8 @@ class TestAccount(unittest.TestCase):
 
     def setUp(self):
         """This runs before each test"""
-        db.session.query(Account).delete()  # clean up the last tests
+        # clean up the last tests
+        db.session.execute(text(f"TRUNCATE {Account.__tablename__} RESTART IDENTITY CASCADE"))
         db.session.commit()
 
     def tearDown(self):
@@ -76,6 +78,15 @@ class TestAccount(unittest.TestCase):
         accounts = Account.all()
         self.assertEqual(len(accounts), 1)
 
+    def test_add_many_accounts(self):
+        """It should Create a batch of accounts with a single commit"""
+        accounts = AccountFactory.create_batch(3)
+        ids = Account.create_many(accounts)
+        # Assert that each was assigned an id and shows up in the database
+        self.assertTrue(all(new_id is not None for new_id in ids))
+        self.assertEqual(len(set(ids)), 3)
+        self.assertEqual(sorted(account.id for account in Account.all()), sorted(ids))
+
     def test_read_account(self):
         """It should Read an account"""
         account = AccountFactory()
@@ -166,6 +177,16 @@ class TestAccount(unittest.TestCase):
         self.assertEqual(new_account.phone_number, account.phone_number)
         self.assertEqual(new_account.date_joined, account.date_joined)
 
+    def test_validate_an_account(self):
+        """It should Validate account data into column values"""
+        account = AccountFactory()
+        values = Account.validate(account.serialize())
+        self.assertNotIn("id", values)
+        self.assertEqual(values["name"], account.name)
+        self.assertEqual(values["phone_number"], account.phone_number)
+        self.assertEqual(values["date_joined"], account.date_joined)
+        self.assertRaises(DataValidationError, Account.validate, {})
+
     def test_deserialize_with_key_error(self):
         """It should not Deserialize an account with a KeyError"""
         account = Account()
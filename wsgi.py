@@ -0,0 +1,24 @@
+"""
+WSGI Entry Point
+
+Serves the Account service with gevent so that requests waiting on the
+database do not block each other. The monkey patching must happen before
+anything else imports socket, threading or psycopg2.
+"""
+# pylint: disable=wrong-import-position
+from gevent import monkey
+
+monkey.patch_all()
+
+from psycogreen.gevent import patch_psycopg  # noqa: E402
+
+# Make psycopg2 yield to the gevent hub while it waits on the database
+patch_psycopg()
+
+import os  # noqa: E402
+from gevent.pywsgi import WSGIServer  # noqa: E402
+from service import app  # noqa: E402, F401
+
+if __name__ == "__main__":
+    port = int(os.getenv("PORT", "8080"))
+    WSGIServer(("0.0.0.0", port), app).serve_forever()